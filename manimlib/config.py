@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import argparse
 import colour
-import importlib
-import inspect
 import os
 import sys
 import yaml
@@ -342,8 +340,8 @@ def load_yaml(file_path: str):
 
 
 def get_manim_dir():
-    manimlib_module = importlib.import_module("manimlib")
-    manimlib_dir = os.path.dirname(inspect.getabsfile(manimlib_module))
+    # This file lives directly in the manimlib package directory
+    manimlib_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.abspath(os.path.join(manimlib_dir, ".."))
 
 
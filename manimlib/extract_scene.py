@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import inspect
+import re
 import sys
 
 from manimlib.module_loader import ModuleLoader
@@ -117,11 +118,9 @@ def get_scene_classes(module: Optional[Module]):
         return module.SCENES_IN_ORDER
     else:
         return [
-            member[1]
-            for member in inspect.getmembers(
-                module,
-                lambda x: is_child_scene(x, module)
-            )
+            obj
+            for _, obj in sorted(vars(module).items())
+            if is_child_scene(obj, module)
         ]
 
 
@@ -165,9 +164,7 @@ def insert_embed_line_to_module(module: Module, run_config: Dict) -> None:
     if not run_config.scene_names:
         classes = list(filter(lambda line: line.startswith("class"), lines[:line_number]))
         if classes:
-            from re import search
-
-            scene_name = search(r"(\w+)\(", classes[-1])
+            scene_name = re.search(r"(\w+)\(", classes[-1])
             run_config.update(scene_names=[scene_name.group(1)])
         else:
             log.error(f"No 'class' found above {line_number}!")
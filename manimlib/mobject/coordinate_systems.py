@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 import numbers
 
 import numpy as np
-import itertools as it
 
 from manimlib.constants import BLACK, BLUE, BLUE_D, BLUE_E, GREEN, GREY_A, RED, DEFAULT_MOBJECT_COLOR
 from manimlib.constants import DEG, PI
@@ -266,10 +265,10 @@ class CoordinateSystem(ABC):
         def get_graph_points():
             xs = x_values
             if get_discontinuities:
-                ds = get_discontinuities()
+                ds = np.fromiter(get_discontinuities(), dtype=float)
                 ep = 1e-6
-                added_xs = it.chain(*((d - ep, d + ep) for d in ds))
-                xs[:] = sorted([*x_values, *added_xs])[:len(x_values)]
+                added_xs = np.hstack([ds - ep, ds + ep])
+                xs[:] = np.sort(np.hstack([x_values, added_xs]))[:len(x_values)]
             return self.c2p(xs, func(xs))
 
         graph.add_updater(
@@ -19,6 +19,17 @@ if TYPE_CHECKING:
 
 
 TEX_MOB_SCALE_FACTOR = 0.001
+_TEX_COMMAND_PATTERN = re.compile(r"""
+    (?P<command>\\(?:[a-zA-Z]+|.))
+    |(?P<open>{+)
+    |(?P<close>}+)
+""", flags=re.X | re.S)
+_TEX_SYMBOL_PATTERN = re.compile("|".join((
+    # Tex commands
+    r"\\[a-zA-Z]+",
+    # And most single characters, with these exceptions
+    r"[^\^\{\}\s\_\$\\\&]",
+)))
 
 
 class Tex(StringMobject):
@@ -80,14 +91,9 @@ class Tex(StringMobject):
     @staticmethod
     def get_command_matches(string: str) -> list[re.Match]:
         # Lump together adjacent brace pairs
-        pattern = re.compile(r"""
-            (?P<command>\\(?:[a-zA-Z]+|.))
-            |(?P<open>{+)
-            |(?P<close>}+)
-        """, flags=re.X | re.S)
         result = []
         open_stack = []
-        for match_obj in pattern.finditer(string):
+        for match_obj in _TEX_COMMAND_PATTERN.finditer(string):
             if match_obj.group("open"):
                 open_stack.append((match_obj.span(), len(result)))
             elif match_obj.group("close"):
@@ -97,10 +103,10 @@ class Tex(StringMobject):
                         raise ValueError("Missing '{' inserted")
                     (open_start, open_end), index = open_stack.pop()
                     n = min(open_end - open_start, close_end - close_start)
-                    result.insert(index, pattern.fullmatch(
+                    result.insert(index, _TEX_COMMAND_PATTERN.fullmatch(
                         string, pos=open_end - n, endpos=open_end
                     ))
-                    result.append(pattern.fullmatch(
+                    result.append(_TEX_COMMAND_PATTERN.fullmatch(
                         string, pos=close_start, endpos=close_start + n
                     ))
                     close_start += n
@@ -212,13 +218,7 @@ class Tex(StringMobject):
         return num_tex_symbols(substr)
 
     def get_symbol_substrings(self):
-        pattern = "|".join((
-            # Tex commands
-            r"\\[a-zA-Z]+",
-            # And most single characters, with these exceptions
-            r"[^\^\{\}\s\_\$\\\&]",
-        ))
-        return re.findall(pattern, self.string)
+        return _TEX_SYMBOL_PATTERN.findall(self.string)
 
     def make_number_changeable(
         self,
@@ -37,6 +37,29 @@ DEFAULT_LINE_SPACING_SCALE = 0.6
 DEFAULT_CANVAS_WIDTH = 16384
 DEFAULT_CANVAS_HEIGHT = 16384
 
+_MARKUP_COMMAND_PATTERN = re.compile(r"""
+    (?P<tag>
+        <
+        (?P<close_slash>/)?
+        (?P<tag_name>\w+)\s*
+        (?P<attr_list>(?:\w+\s*\=\s*(?P<quot>["']).*?(?P=quot)\s*)*)
+        (?P<elision_slash>/)?
+        >
+    )
+    |(?P<passthrough>
+        <\?.*?\?>|<!--.*?-->|<!\[CDATA\[.*?\]\]>|<!DOCTYPE.*?>
+    )
+    |(?P<entity>&(?P<unicode>\#(?P<hex>x)?)?(?P<content>.*?);)
+    |(?P<char>[>"'])
+""", flags=re.X | re.S)
+_MARKUP_ATTR_PATTERN = re.compile(r"""
+    (?P<attr_name>\w+)
+    \s*\=\s*
+    (?P<quot>["'])(?P<attr_val>.*?)(?P=quot)
+""", flags=re.X | re.S)
+_TEXT_COMMAND_PATTERN = re.compile(r"""[<>&"']""")
+_CODE_TT_TAG_PATTERN = re.compile(r"</?tt>")
+
 
 # Temporary handler
 class _Alignment:
@@ -120,6 +143,10 @@ class MarkupText(StringMobject):
         "\"": "&quot;",
         "'": "&apos;"
     }
+    MARKUP_ENTITY_REVERSED_DICT = {
+        v: k
+        for k, v in MARKUP_ENTITY_DICT.items()
+    }
 
     def __init__(
         self,
@@ -208,31 +235,13 @@ class MarkupText(StringMobject):
 
     @staticmethod
     def unescape_markup_char(substr: str) -> str:
-        return {
-            v: k
-            for k, v in MarkupText.MARKUP_ENTITY_DICT.items()
-        }.get(substr, substr)
+        return MarkupText.MARKUP_ENTITY_REVERSED_DICT.get(substr, substr)
 
     # Parsing
 
     @staticmethod
     def get_command_matches(string: str) -> list[re.Match]:
-        pattern = re.compile(r"""
-            (?P<tag>
-                <
-                (?P<close_slash>/)?
-                (?P<tag_name>\w+)\s*
-                (?P<attr_list>(?:\w+\s*\=\s*(?P<quot>["']).*?(?P=quot)\s*)*)
-                (?P<elision_slash>/)?
-                >
-            )
-            |(?P<passthrough>
-                <\?.*?\?>|<!--.*?-->|<!\[CDATA\[.*?\]\]>|<!DOCTYPE.*?>
-            )
-            |(?P<entity>&(?P<unicode>\#(?P<hex>x)?)?(?P<content>.*?);)
-            |(?P<char>[>"'])
-        """, flags=re.X | re.S)
-        return list(pattern.finditer(string))
+        return list(_MARKUP_COMMAND_PATTERN.finditer(string))
 
     @staticmethod
     def get_command_flag(match_obj: re.Match) -> int:
@@ -268,17 +277,12 @@ class MarkupText(StringMobject):
     def get_attr_dict_from_command_pair(
         open_command: re.Match, close_command: re.Match
     ) -> dict[str, str] | None:
-        pattern = r"""
-            (?P<attr_name>\w+)
-            \s*\=\s*
-            (?P<quot>["'])(?P<attr_val>.*?)(?P=quot)
-        """
         tag_name = open_command.group("tag_name")
         if tag_name == "span":
             return {
                 match_obj.group("attr_name"): match_obj.group("attr_val")
-                for match_obj in re.finditer(
-                    pattern, open_command.group("attr_list"), re.S | re.X
+                for match_obj in _MARKUP_ATTR_PATTERN.finditer(
+                    open_command.group("attr_list")
                 )
             }
         return MarkupText.MARKUP_TAGS.get(tag_name, {})
@@ -407,8 +411,7 @@ class Text(MarkupText):
 
     @staticmethod
     def get_command_matches(string: str) -> list[re.Match]:
-        pattern = re.compile(r"""[<>&"']""")
-        return list(pattern.finditer(string))
+        return list(_TEXT_COMMAND_PATTERN.finditer(string))
 
     @staticmethod
     def get_command_flag(match_obj: re.Match) -> int:
@@ -442,7 +445,7 @@ class Code(MarkupText):
             style=code_style
         )
         markup = pygments.highlight(code, lexer, formatter)
-        markup = re.sub(r"</?tt>", "", markup)
+        markup = _CODE_TT_TAG_PATTERN.sub("", markup)
         super().__init__(
             markup,
             font=font,
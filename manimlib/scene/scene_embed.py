@@ -119,8 +119,9 @@ class InteractiveSceneEmbed:
             with open(file_path, 'r', encoding='utf-8') as f:
                 source_code = f.read()
 
-            # Use compile() to check for syntax errors without executing
-            compile(source_code, file_path, 'exec')
+            # Use compile() to check for syntax errors without executing,
+            # and without inheriting this module's __future__ flags
+            compile(source_code, file_path, 'exec', dont_inherit=True)
             return True
 
         except SyntaxError as e:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 import numpy as np
 from scipy import linalg
 from fontTools.cu2qu.cu2qu import curve_to_quadratic
@@ -101,7 +103,6 @@ def interpolate(start: Scalable, end: Scalable, alpha: float | VectN) -> Scalabl
         log.debug(f"`start` parameter with type `{type(start)}` and dtype `{start.dtype}`")
         log.debug(f"`end` parameter with type `{type(end)}` and dtype `{end.dtype}`")
         log.debug(f"`alpha` parameter with value `{alpha}`")
-        import sys
         sys.exit(2)
 
 
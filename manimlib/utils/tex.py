@@ -6,19 +6,25 @@ from functools import lru_cache
 from manimlib.utils.tex_to_symbol_count import TEX_TO_SYMBOL_COUNT
 
 
+TEX_COMMANDS_PATTERN = re.compile(r"""
+    (?P<sqrt>\\sqrt\[[0-9]+\])|    # Special sqrt with number
+    (?P<escaped_brace>\\[{}])|      # Escaped braces
+    (?P<cmd>\\[a-zA-Z!,-/:;<>]+)    # Regular commands
+""", flags=re.VERBOSE)
+TEX_PHANTOM_PATTERN = re.compile(r"\\phantom\{[^}]*\}")
+TEX_ENVIRONMENT_PATTERN = re.compile(r"\\(begin|end)(\{\w+\})?(\{\w+\})?(\[\w+\])?")
+# Used with str.translate to drop characters which don't render as symbols
+TEX_NON_SYMBOL_TABLE = str.maketrans("", "", "^{} \n\t_$\\&")
+
+
 @lru_cache
 def num_tex_symbols(tex: str) -> int:
     tex = remove_tex_environments(tex)
-    commands_pattern = r"""
-        (?P<sqrt>\\sqrt\[[0-9]+\])|    # Special sqrt with number
-        (?P<escaped_brace>\\[{}])|      # Escaped braces
-        (?P<cmd>\\[a-zA-Z!,-/:;<>]+)    # Regular commands
-    """
     total = 0
     pos = 0
-    for match in re.finditer(commands_pattern, tex, re.VERBOSE):
+    for match in TEX_COMMANDS_PATTERN.finditer(tex):
         # Count normal characters up to this command
-        total += sum(1 for c in tex[pos:match.start()] if c not in "^{} \n\t_$\\&")
+        total += len(tex[pos:match.start()].translate(TEX_NON_SYMBOL_TABLE))
 
         if match.group("sqrt"):
             total += len(match.group()) - 5
@@ -29,13 +35,15 @@ def num_tex_symbols(tex: str) -> int:
         pos = match.end()
 
     # Count remaining characters
-    total += sum(1 for c in tex[pos:] if c not in "^{} \n\t_$\\&")
+    total += len(tex[pos:].translate(TEX_NON_SYMBOL_TABLE))
     return total
 
 
 def remove_tex_environments(tex: str) -> str:
     # Handle \phantom{...} with any content
-    tex = re.sub(r"\\phantom\{[^}]*\}", "", tex)
-    # Handle other environment commands
-    tex = re.sub(r"\\(begin|end)(\{\w+\})?(\{\w+\})?(\[\w+\])?", "", tex)
+    tex = TEX_PHANTOM_PATTERN.sub("", tex)
+    # Handle other environment commands. This must be a second pass, since
+    # removing a phantom can bring an environment command next to its
+    # arguments, e.g. "\end\phantom{}{x}" should reduce to ""
+    tex = TEX_ENVIRONMENT_PATTERN.sub("", tex)
     return tex